@@ -1,3 +1,6 @@
+from functools import lru_cache
+
+
 class Style:
     RESET            = '\033[0m'  
 
@@ -38,4 +41,12 @@ RESET = Style.RESET
 MAGENTA = Style.MAGENTA
 YELLOW = Style.YELLOW
 RED = Style.RED
-GREEN = Style.GREEN
\ No newline at end of file
+GREEN = Style.GREEN
+
+
+@lru_cache(maxsize=256)
+def menu_number(index: int) -> str:
+    """
+    Returns `[index]` with the number in green. Cached since the same numbers are re-rendered on every listing
+    """
+    return f'[{GREEN}{index}{RESET}]'
@@ -1,66 +1,108 @@
-import json
+from functools import lru_cache
 from random import choice
 
+import orjson
+
 from ..exceptions.error_handling import (
     FailedToAddArtistToTable,
     FailedToRemoveArtistFromTable,
     FailedToRetrieveListOfMatchesWithIDs,
     FailedToRetrieveMonitoredArtists,
 )
-from ..ui.colors import GREEN, RED, RESET, YELLOW
+from ..ui.colors import GREEN, RED, RESET, YELLOW, menu_number
 from ..utils.input_validator import Input
+from .disk_cache import DiskCache
 from .signed_requests import Requests
 
-YES_CHOICES = ['y', 'yes', 'yeah', 'yup', 'yep', 'yea', 'ya', 'yah']
-NO_CHOICES = ['n', 'no', 'nope', 'nah', 'naw', 'na']
-GO_BACK_CHOICES = ['b', 'back']
-CACHED_ARTIST_LIST: list = []  # Local memory storage of the current artists I am monitoring
+GO_BACK_CHOICES = frozenset({'b', 'back'})
+QUIT_CHOICES = frozenset({'q', 'quit', 'exit', 'done'})
+MENU_RETURN_CHOICES = frozenset({'b', 'back', ''})  # Pressing [ENTER] also returns to the main menu
+MENU_LOOP_CHOICES = QUIT_CHOICES | MENU_RETURN_CHOICES
+CACHED_ARTISTS: dict[str, str] = {}  # Local memory storage of the artists I am monitoring. Maps ID -> name
 IS_CACHE_EMPTY: bool = False
+ARTIST_CACHE_TTL = 300  # Seconds the monitored artist list is kept on disk between app sessions
 
 
-def list_artists(apigw_endpoint: str, aws_profile: str, continue_prompt=False) -> None:
+def load_artists(apigw_endpoint: str, aws_profile: str) -> None:
     """
-    Prints out a list of the current artists that are being monitored
-
-    Parameters:
-        - continue_prompt (boolean): Whether the user is returned with the main menu after function execution or not.
+    Populates the local artist cache if it isn't already. Tries the copy saved on disk by a recent
+    session first, then falls back to invoking Lambda to fetch fresh data.
     """
 
-    global CACHED_ARTIST_LIST, IS_CACHE_EMPTY
+    global CACHED_ARTISTS, IS_CACHE_EMPTY
 
-    # Check if either the cache has items or the `IS_CACHE_EMPTY` flag is set to True
-    # If neither is true, invoke Lambda to fetch fresh data
-    if len(CACHED_ARTIST_LIST) > 0 or IS_CACHE_EMPTY:
-        if CACHED_ARTIST_LIST:
-            for index, artist in enumerate(CACHED_ARTIST_LIST, start=1):
-                print(f'\n\t[{GREEN}{index}{RESET}] {artist["artist_name"]}')
-        else:
-            print(f'{YELLOW}\n\tNo artists currently being monitored.{RESET}')
-    else:
-        # Fetch fresh data
-        response = Requests.signed_request('GET', f'{apigw_endpoint}artist', aws_profile)
+    # Cache already has items or we know there are no artists being monitored
+    if CACHED_ARTISTS or IS_CACHE_EMPTY:
+        return
 
-        if response.status_code == 204:
-            print(f'{YELLOW}\n\tNo artists currently being monitored.{RESET}')
-            CACHED_ARTIST_LIST = []
-            IS_CACHE_EMPTY = True
-            return None
+    cached_artists: dict[str, str] | None = DiskCache.read(aws_profile, 'artists')
+    if isinstance(cached_artists, dict):
+        CACHED_ARTISTS = cached_artists
+        IS_CACHE_EMPTY = not cached_artists
+        return
+
+    # Fetch fresh data
+    response = Requests.signed_request('GET', f'{apigw_endpoint}artist', aws_profile)
 
-        response_data: dict = response.json()
+    if response.status_code == 204:
+        CACHED_ARTISTS = {}
+        IS_CACHE_EMPTY = True
+    else:
+        response_data: dict = Requests.load_json(response)
         if response_data.get('error_type') == 'Client':
             raise FailedToRetrieveMonitoredArtists(response_data['error'])
 
-        print('\nCurrent monitored artists:')
-        list_of_names: list[str] = response_data['artists']['current_artists_names']
-        for index, artist in enumerate(list_of_names, start=1):
-            print(f'\n\t[{GREEN}{index}{RESET}] {artist}')
-
-        CACHED_ARTIST_LIST = response_data['artists']['current_artists_with_id']
+        CACHED_ARTISTS = {
+            artist['artist_id']: artist['artist_name'] for artist in response_data['artists']['current_artists_with_id']
+        }
         IS_CACHE_EMPTY = False
 
+    DiskCache.write(aws_profile, 'artists', CACHED_ARTISTS, ttl=ARTIST_CACHE_TTL)
+
+
+@lru_cache(maxsize=512)
+def title_case_genre(genre: str) -> str:
+    """
+    Title-cases a genre name. Cached since the same genres repeat across artists in search results.
+    """
+    return genre.title()
+
+
+def format_genres(genres: list[str]) -> str:
+    """
+    Formats an artist's genres into a comma separated string
+    """
+    return ', '.join(map(title_case_genre, genres)) if genres else 'N/A'
+
+
+def list_artists(apigw_endpoint: str, aws_profile: str, continue_prompt=False) -> None:
+    """
+    Prints out a list of the current artists that are being monitored
+
+    Parameters:
+        - continue_prompt (boolean): Whether the user is returned with the main menu after function execution or not.
+    """
+    load_artists(apigw_endpoint, aws_profile)
+    render_artists()
     menu_loop_prompt(continue_prompt)
 
 
+def render_artists() -> None:
+    """
+    Prints the cached list of monitored artists. Never reaches out to the API,
+    so callers need to have run `load_artists` first.
+    """
+    if CACHED_ARTISTS:
+        # Render the whole list in a single write instead of one per artist
+        artist_lines = (
+            f'\n\t{menu_number(index)} {artist_name}'
+            for index, artist_name in enumerate(CACHED_ARTISTS.values(), start=1)
+        )
+        print('\nCurrent monitored artists:\n' + '\n'.join(artist_lines))
+    else:
+        print(f'{YELLOW}\n\tNo artists currently being monitored.{RESET}')
+
+
 def fetch_artist_id(
     artist_name: str, access_token: str, apigw_endpoint: str, aws_profile: str
 ) -> tuple[str, str] | None:
@@ -77,62 +119,55 @@ def fetch_artist_id(
         tuple[str, str]: A tuple containing the confirmed artist's Spotify ID and name
     """
 
-    payload = json.dumps({'artist_name': artist_name, 'access_token': access_token})
-    response = Requests.signed_request('POST', f'{apigw_endpoint}artist/id', aws_profile, payload=payload.encode())
+    payload = orjson.dumps({'artist_name': artist_name, 'access_token': access_token})
+    response = Requests.signed_request('POST', f'{apigw_endpoint}artist/id', aws_profile, payload=payload)
+    response_data: dict = Requests.load_json(response)
 
     # Catch any errors that occurred during GET request to Spotify API.
-    if response.json().get('error_type') == 'HTTP':
-        raise FailedToRetrieveListOfMatchesWithIDs(response.json()['error'])
-    elif len(response.json()['artistSearchResultsList']) == 0:
+    if response_data.get('error_type') == 'HTTP':
+        raise FailedToRetrieveListOfMatchesWithIDs(response_data['error'])
+
+    search_results: list[dict] = response_data['artistSearchResultsList']
+    if len(search_results) == 0:
         raise FailedToRetrieveListOfMatchesWithIDs('No artists found that closely match your search.')
 
     first_artist_guess = {
-        'artist_id': response.json()['artistSearchResultsList'][0]['id'],
-        'artist_name': response.json()['artistSearchResultsList'][0]['name'],
+        'artist_id': search_results[0]['id'],
+        'artist_name': search_results[0]['name'],
     }
 
     # Serve user the most likely artist they were looking for. Ask for confirmation
-    answer = Input.validate(
-        prompt=f'\nIs {GREEN}{first_artist_guess["artist_name"]}{RESET} the artist you were looking for? (yes or no)\n> ',
-        valid_choices=(YES_CHOICES + NO_CHOICES),
+    confirmed = Input.confirm(
+        prompt=f'\nIs {GREEN}{first_artist_guess["artist_name"]}{RESET} the artist you were looking for? (yes or no)\n> '
     )
 
     # If the user confirmed the artist, return the most likely artist's Spotify ID and name
-    if answer in YES_CHOICES:
+    if confirmed:
         return first_artist_guess['artist_id'], first_artist_guess['artist_name']
-    elif answer in NO_CHOICES:
-
-        # Print list of the other most likely choices and have them choose
-        for index, artist in enumerate(response.json()['artistSearchResultsList'], start=1):
-            print(f'\n[{GREEN}{index}{RESET}]')
-            print(f'\tArtist: {artist["name"]}')
-
-            # Format genres into a string
-            genres = artist['genres']
-            if genres:
-                genres_str = ', '.join(genre.title() for genre in genres)
-            else:
-                genres_str = 'N/A'
+    else:
 
-            # Print out genres for each choice to help add context to user
-            print(f'\tGenre(s): {genres_str}')
+        # Print list of the other most likely choices and have them choose. Genres are included
+        # to help add context to user. Whole list is rendered in a single write
+        print(
+            '\n'.join(
+                f'\n{menu_number(index)}\n\tArtist: {artist["name"]}\n\tGenre(s): {format_genres(artist["genres"])}'
+                for index, artist in enumerate(search_results, start=1)
+            )
+        )
 
         # Prompt user for artist choice again
-        user_choice = Input.validate(
+        user_choice = Input.validate_selection(
             prompt=f'\nWhich artist were you looking for? Select the number. (or enter {YELLOW}`back`{RESET} to return to search prompt)\n> ',
-            valid_choices=[
-                str(option_index)
-                for option_index, artist in enumerate(response.json()['artistSearchResultsList'], start=1)
-            ]
-            + GO_BACK_CHOICES,
+            option_count=len(search_results),
+            extra_choices=GO_BACK_CHOICES,
         )
 
-        # If user choice matches an option, then return that artist's Spotify ID and name
-        for option_index, artist in enumerate(response.json()['artistSearchResultsList'], start=1):
-            if user_choice in GO_BACK_CHOICES:
-                return None
-            elif int(user_choice) == option_index:
-                return artist['id'], artist['name']
+        if user_choice in GO_BACK_CHOICES:
+            return None
+
+        # Otherwise the choice is a valid option number, so return that artist's Spotify ID and name
+        artist = search_results[int(user_choice) - 1]
+        return artist['id'], artist['name']
 
 
 def add_artist(access_token: str, apigw_endpoint: str, aws_profile: str, continue_prompt=False) -> None:
@@ -145,13 +180,14 @@ def add_artist(access_token: str, apigw_endpoint: str, aws_profile: str, continu
         - continue_prompt (boolean): Whether the user is returned with the main menu after function execution or not.
     """
 
-    global CACHED_ARTIST_LIST
+    global IS_CACHE_EMPTY
 
     while True:
 
         # Show user a list of the artist they are already monitoring and then
         # ask user for which artist they want to search for
-        list_artists(apigw_endpoint, aws_profile)
+        load_artists(apigw_endpoint, aws_profile)
+        render_artists()
         user_artist_choice = input("\nWhich artist would you like to start monitoring?\n> ")
 
         # Query Spotify API to get a list of the closest matches to the user's search
@@ -164,22 +200,24 @@ def add_artist(access_token: str, apigw_endpoint: str, aws_profile: str, continu
 
         # If user confirmed, then prepare payload to be sent to Lambda function
         artist_id, artist_name = result
-        artist = {'artist_id': artist_id, 'artist_name': artist_name}
 
         # Find out if artist is already in list. If not, add the artist
-        if artist in CACHED_ARTIST_LIST:
+        if artist_id in CACHED_ARTISTS:
             print(f'\nYou\'re already monitoring {GREEN}{artist_name}{RESET}!')
         else:
-            payload = json.dumps(artist)
-            response = Requests.signed_request('POST', f'{apigw_endpoint}artist', aws_profile, payload=payload.encode())
+            payload = orjson.dumps({'artist_id': artist_id, 'artist_name': artist_name})
+            response = Requests.signed_request('POST', f'{apigw_endpoint}artist', aws_profile, payload=payload)
 
             # Catch any errors that occurred during PUT request on the DynamoDB table.
-            if response.json().get('error_type') == 'Client':
-                raise FailedToAddArtistToTable(response.json()['error'])
+            response_data: dict = Requests.load_json(response)
+            if response_data.get('error_type') == 'Client':
+                raise FailedToAddArtistToTable(response_data['error'])
             else:
 
                 # Update cache with new addition
-                CACHED_ARTIST_LIST.append(artist)
+                CACHED_ARTISTS[artist_id] = artist_name
+                IS_CACHE_EMPTY = False
+                DiskCache.invalidate(aws_profile, 'artists')
                 print(f'\n\tYou are now monitoring for {GREEN}{artist_name}{RESET}\'s new music!')
                 break
 
@@ -194,44 +232,44 @@ def remove_artist(apigw_endpoint: str, aws_profile: str, continue_prompt=False)
         - continue_prompt (boolean): Whether the user is returned with the main menu after function execution or not.
     """
 
-    global CACHED_ARTIST_LIST
+    global IS_CACHE_EMPTY
 
     # If there are currently no artists to remove, then exit the function
-    list_artists(apigw_endpoint, aws_profile)
-    if not CACHED_ARTIST_LIST:
+    load_artists(apigw_endpoint, aws_profile)
+    render_artists()
+    if not CACHED_ARTISTS:
         print(f"{YELLOW}\n\tThere are no artists to remove!{RESET}")
         menu_loop_prompt(continue_prompt)
         return
 
     # Otherwise, ask them which artist they would like to remove
-    user_choice = Input.validate(
+    user_choice = Input.validate_selection(
         prompt=f'\nWhich artist would you like to remove? Make a selection: (or enter {YELLOW}`back`{RESET} to return to main menu)\n> ',
-        valid_choices=[str(choice_index) for choice_index, artist in enumerate(CACHED_ARTIST_LIST, start=1)]
-        + GO_BACK_CHOICES,
+        option_count=len(CACHED_ARTISTS),
+        extra_choices=GO_BACK_CHOICES,
     )
 
-    for choice_index, artist in enumerate(CACHED_ARTIST_LIST, start=1):
-        if user_choice in GO_BACK_CHOICES:
-            return
-        elif int(user_choice) == choice_index:
-            payload = json.dumps(
-                {
-                    'artist_id': CACHED_ARTIST_LIST[int(user_choice) - 1]['artist_id'],
-                    'artist_name': CACHED_ARTIST_LIST[int(user_choice) - 1]['artist_name'],
-                }
-            )
-            response = Requests.signed_request(
-                'DELETE', f'{apigw_endpoint}artist', aws_profile, payload=payload.encode()
-            )
+    if user_choice in GO_BACK_CHOICES:
+        return
 
-            # Catch any errors that occurred during DELETE request on the DynamoDB table.
-            if response.json().get('error_type') == 'Client':
-                raise FailedToRemoveArtistFromTable(response.json()['error'])
-            else:
+    # Menu numbers follow the cache's insertion order
+    artist_id = list(CACHED_ARTISTS)[int(user_choice) - 1]
+    artist_name = CACHED_ARTISTS[artist_id]
 
-                # Update cache by removing artist
-                CACHED_ARTIST_LIST.pop(int(user_choice) - 1)
-                print(f"\n\tRemoved {GREEN}{artist['artist_name']}{RESET} from list!")
+    payload = orjson.dumps({'artist_id': artist_id, 'artist_name': artist_name})
+    response = Requests.signed_request('DELETE', f'{apigw_endpoint}artist', aws_profile, payload=payload)
+
+    # Catch any errors that occurred during DELETE request on the DynamoDB table.
+    response_data: dict = Requests.load_json(response)
+    if response_data.get('error_type') == 'Client':
+        raise FailedToRemoveArtistFromTable(response_data['error'])
+    else:
+
+        # Update cache by removing artist
+        del CACHED_ARTISTS[artist_id]
+        IS_CACHE_EMPTY = not CACHED_ARTISTS
+        DiskCache.invalidate(aws_profile, 'artists')
+        print(f"\n\tRemoved {GREEN}{artist_name}{RESET} from list!")
 
     menu_loop_prompt(continue_prompt)
 
@@ -259,16 +297,13 @@ def menu_loop_prompt(continue_prompt: bool) -> None:
     If True is passed in, user will be prompted to continue to main menu.
     Otherwise, app will quit
     """
-    quit_choices = ['q', 'quit', 'exit', 'done']
-    go_back_choices = ['b', 'back', '']
-
     if continue_prompt:
         user_choice = Input.validate(
             prompt=f"\nPress {GREEN}[ENTER]{RESET} to go back to main menu... (Or enter {YELLOW}quit{RESET} to quit app)\n> ",
-            valid_choices=(quit_choices + go_back_choices),
+            valid_choices=MENU_LOOP_CHOICES,
         )
 
-        if user_choice in quit_choices:
+        if user_choice in QUIT_CHOICES:
             quit()
-        elif user_choice in go_back_choices:
+        elif user_choice in MENU_RETURN_CHOICES:
             return
@@ -0,0 +1,72 @@
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+CACHE_DIR = Path.home() / '.spotificity'
+
+
+class DiskCache:
+    """
+    Class for persisting small JSON blobs between app sessions. Entries are stored per
+    awscli profile, so different environments never share cached data, and expire after a TTL.
+    """
+
+    @staticmethod
+    def _path(aws_profile: str, name: str) -> Path:
+        return CACHE_DIR / aws_profile / f'{name}.json'
+
+    @staticmethod
+    def read(aws_profile: str, name: str) -> Any | None:
+        """
+        Returns the cached data, or None if there is no entry, it has expired, or the file is malformed
+        """
+        try:
+            entry = orjson.loads(DiskCache._path(aws_profile, name).read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+        if not isinstance(entry, dict):
+            return None
+
+        expires_at = entry.get('expires_at')
+        if not isinstance(expires_at, (int, float)) or time.time() >= expires_at:
+            return None
+        return entry.get('data')
+
+    @staticmethod
+    def write(aws_profile: str, name: str, data: Any, ttl: float) -> None:
+        """
+        Stores data for `ttl` seconds. Caching is best-effort, so failing to write is not an error.
+        Access tokens are stored here, so directories are private to the user and files are written
+        to a 0600 temp file that atomically replaces the old entry.
+        """
+        path = DiskCache._path(aws_profile, name)
+        try:
+            for directory in (CACHE_DIR, path.parent):
+                directory.mkdir(mode=0o700, exist_ok=True)
+                directory.chmod(0o700)  # mkdir leaves the mode of existing directories alone
+
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as tmp_file:
+                    tmp_file.write(orjson.dumps({'expires_at': time.time() + ttl, 'data': data}))
+                os.replace(tmp_path, path)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+
+    @staticmethod
+    def invalidate(aws_profile: str, name: str) -> None:
+        """
+        Removes a cached entry so the next read goes back to the API
+        """
+        try:
+            DiskCache._path(aws_profile, name).unlink(missing_ok=True)
+        except OSError:
+            pass
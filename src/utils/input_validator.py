@@ -1,3 +1,5 @@
+from collections.abc import Collection
+
 from ..ui.colors import RESET, YELLOW
 
 
@@ -7,7 +9,7 @@ class Input:
     """
 
     @staticmethod
-    def validate(prompt: str, valid_choices: list[str]) -> str:
+    def validate(prompt: str, valid_choices: Collection[str]) -> str:
         """
         Instead of using nested while loops, this function uses a single while loop
         to prompt the user for input until they enter a valid selection.
@@ -18,3 +20,31 @@ class Input:
                 return user_input
             else:
                 print(f'{YELLOW}\n\tPlease enter a valid selection.{RESET}')
+
+    @staticmethod
+    def validate_selection(prompt: str, option_count: int, extra_choices: Collection[str] = ()) -> str:
+        """
+        Same as `validate`, but for numbered menus. Any number from 1 to `option_count` is accepted
+        along with `extra_choices`, checked by direct comparison instead of building a list of every option.
+        """
+        while True:
+            user_input = input(prompt).lower()
+            if user_input in extra_choices or (user_input.isdecimal() and 1 <= int(user_input) <= option_count):
+                return user_input
+            else:
+                print(f'{YELLOW}\n\tPlease enter a valid selection.{RESET}')
+
+    @staticmethod
+    def confirm(prompt: str) -> bool:
+        """
+        Prompts the user with a yes or no question until they answer. Only the first character
+        of the answer matters, so 'y', 'yes', 'yeah', etc. are all treated as yes.
+        """
+        while True:
+            answer = input(prompt)[:1].lower()
+            if answer == 'y':
+                return True
+            elif answer == 'n':
+                return False
+            else:
+                print(f'{YELLOW}\n\tPlease enter a valid selection.{RESET}')
@@ -1,10 +1,25 @@
-from boto3 import Session
-from botocore.exceptions import ClientError
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
 from ..helpers.constants import Account, accounts
 from ..ui.colors import RED
 from .argparser import ArgParser
-from .signed_requests import Requests
+from .disk_cache import DiskCache
+from .signed_requests import Requests, get_aws_session
+
+if TYPE_CHECKING:
+    from botocore.exceptions import ClientError
+
+SPOTIFY_TOKEN_LIFETIME = 3600  # Spotify access tokens are valid for one hour
+TOKEN_EXPIRY_BUFFER = 30  # Refresh the token this many seconds before it actually expires
+BOTO_CONFIG_OPTIONS = {
+    'tcp_keepalive': True,
+    'retries': {'mode': 'standard', 'max_attempts': 3},
+    'connect_timeout': 3,
+    'read_timeout': 30,
+}
 
 
 class FailedToRetrieveEndpoint(Exception):
@@ -12,7 +27,7 @@ class FailedToRetrieveEndpoint(Exception):
     Raised when app fails to retrieve endpoint from SSM Parameter Store
     """
 
-    def __init__(self, error_message: ClientError) -> None:
+    def __init__(self, error_message: 'ClientError') -> None:
         self.err = error_message
 
     def __str__(self) -> str:
@@ -33,7 +48,12 @@ class InitialSetup:
     Class to handle initial setup of application.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, prefetch: Callable[[str, str], None] | None = None) -> None:
+        """
+        Parameters:
+            - prefetch (callable): Optional function taking (apigw_endpoint, aws_profile) that is run
+              concurrently with the access token request to warm up data needed by the first menu action.
+        """
         argparser = ArgParser()
         self._aws_profile = argparser.profile_name
 
@@ -43,15 +63,41 @@ class InitialSetup:
                 break
 
         self._endpoint = self.get_apigw_endpoint(self._aws_profile, self._account)
-        self._access_token = self.request_access_token(self._endpoint, self.aws_profile)
+        self._token_expires_at: float = 0
+
+        # Both are independent round trips, so overlap them instead of paying for each in turn.
+        # A failed prefetch is not fatal here; the data will be requested again when it's needed.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            if prefetch is not None:
+                executor.submit(prefetch, self._endpoint, self._aws_profile)
+            self._access_token = self.load_access_token()
+
+    def load_access_token(self) -> str:
+        """
+        Reuse the access token saved by a previous session if it is still valid,
+        otherwise request a new one.
+        """
+        cached_token = DiskCache.read(self._aws_profile, 'token')
+        if (
+            isinstance(cached_token, dict)
+            and isinstance(cached_token.get('access_token'), str)
+            and isinstance(cached_token.get('expires_at'), (int, float))
+        ):
+            self._token_expires_at = cached_token['expires_at']
+            return cached_token['access_token']
+
+        # Nothing cached, or the cached entry is malformed, so treat it as a miss
+        return self.request_access_token(self._endpoint, self._aws_profile)
 
     def get_apigw_endpoint(self, aws_profile: str, account: Account) -> str:
         """
         Retrieve API Gateway endpoint Url from SSM Parameter Store
         """
+        from botocore.config import Config
+        from botocore.exceptions import ClientError
+
         try:
-            session = Session(profile_name=aws_profile)
-            ssm = session.client('ssm')
+            ssm = get_aws_session(aws_profile).client('ssm', config=Config(**BOTO_CONFIG_OPTIONS))
             parameter = ssm.get_parameter(Name=account.api_gw_endpoint_ssm_param_name, WithDecryption=True)
         except ClientError as err:
             raise FailedToRetrieveEndpoint(err)
@@ -61,14 +107,24 @@ class InitialSetup:
     def request_access_token(self, apigw_endpoint: str, aws_profile: str) -> str:
         """
         Invoke Lambda function that fetches an Authenticated access token
-        needed for all future API calls to Spotify.
+        needed for all future API calls to Spotify. Records when the token expires
+        so it can be reused until then.
         """
         response = Requests.signed_request('GET', f'{apigw_endpoint}token', aws_profile)
+        response_data: dict = Requests.load_json(response)
 
-        if response.json().get('access_token') is None:
+        if response_data.get('access_token') is None:
             raise FailedToRetrieveToken
         else:
-            return response.json()['access_token']
+            expires_in: int = response_data.get('expires_in', SPOTIFY_TOKEN_LIFETIME)
+            self._token_expires_at = time.time() + expires_in
+            DiskCache.write(
+                aws_profile,
+                'token',
+                {'access_token': response_data['access_token'], 'expires_at': self._token_expires_at},
+                ttl=expires_in - TOKEN_EXPIRY_BUFFER,
+            )
+            return response_data['access_token']
 
     @property
     def account(self) -> Account:
@@ -87,5 +143,7 @@ class InitialSetup:
 
     @property
     def access_token(self) -> str:
-        """Authenticated Spotify access token"""
+        """Authenticated Spotify access token. Refreshed once it is about to expire"""
+        if time.time() >= self._token_expires_at - TOKEN_EXPIRY_BUFFER:
+            self._access_token = self.request_access_token(self._endpoint, self._aws_profile)
         return self._access_token
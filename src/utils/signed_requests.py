@@ -1,49 +1,106 @@
+from functools import cache
+from typing import TYPE_CHECKING
+
+import orjson
 import requests
-from boto3 import Session
-from requests import HTTPError, Response
+from requests import RequestException, Response
+from requests.adapters import HTTPAdapter
 from requests_aws4auth import AWS4Auth
+from urllib3.util.retry import Retry
 
 from ..ui.colors import RED
 
+if TYPE_CHECKING:
+    from boto3 import Session
+
 
 class FailedToSendSignedRequest(Exception):
-    def __init__(self, err_message: HTTPError) -> None:
+    def __init__(self, err_message: RequestException) -> None:
         self.err = err_message
 
     def __str__(self) -> str:
         return f'\n\n{RED}Failed to send signed request:\n{self.err}'
 
 
+REQUEST_TIMEOUT = (3, 30)  # (connect, read) timeouts in seconds
+
+# Shared HTTP session so the TLS connection to API Gateway is kept alive between menu actions.
+# GETs are retried on transient gateway errors instead of surfacing them to the user. Mutations are never
+# retried since the backend may have already applied them, and read timeouts are never retried so a slow
+# endpoint fails after a single REQUEST_TIMEOUT.
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount(
+    'https://',
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=3,
+            read=False,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({'GET'}),
+            raise_on_status=False,
+        ),
+    ),
+)
+
+
+@cache
+def get_aws_session(aws_profile: str) -> 'Session':
+    """
+    Returns a boto3 Session for the given awscli profile. Sessions are cached per profile so
+    credential resolution only happens once for the lifetime of the app instead of on every request.
+    boto3 is imported here rather than at module level since loading it is slow, and the app
+    should be able to start (and parse its arguments) before it's needed.
+    """
+    from boto3 import Session
+
+    return Session(profile_name=aws_profile)
+
+
+@cache
+def get_request_signer(aws_profile: str, service: str) -> AWS4Auth:
+    """
+    Returns a SigV4 signer for the given profile and service. The signer holds the session's
+    refreshable credentials, so it can be reused across requests without going stale.
+    """
+    credentials = get_aws_session(aws_profile).get_credentials()
+    return AWS4Auth(region='us-east-1', service=service, refreshable_credentials=credentials)
+
+
 class Requests:
     """
     Class for sending signed HTTP requests to AWS services.
     """
 
     @staticmethod
-    def signed_request(method: str, url: str, aws_profile: str, service='execute-api', payload=None) -> Response:
-        credentials = Session(profile_name=aws_profile).get_credentials()
-        auth = AWS4Auth(
-            credentials.access_key,
-            credentials.secret_key,
-            'us-east-1',
-            service,
-            session_token=credentials.token,
-        )
+    def signed_request(
+        method: str, url: str, aws_profile: str, service='execute-api', payload: bytes | None = None
+    ) -> Response:
+        auth = get_request_signer(aws_profile, service)
 
         http_method_map = {
-            'GET': requests.get,
-            'POST': requests.post,
-            'PUT': requests.put,
-            'DELETE': requests.delete,
+            'GET': HTTP_SESSION.get,
+            'POST': HTTP_SESSION.post,
+            'PUT': HTTP_SESSION.put,
+            'DELETE': HTTP_SESSION.delete,
         }
         http_request_method = http_method_map[method]
 
         try:
             response: Response = http_request_method(
-                url, auth=auth, data=payload, headers={'Content-Type': 'application/json'}
+                url, auth=auth, data=payload, headers={'Content-Type': 'application/json'}, timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
-        except HTTPError as err:
+        except RequestException as err:
             raise FailedToSendSignedRequest(err)
         else:
             return response
+
+    @staticmethod
+    def load_json(response: Response) -> dict:
+        """
+        Decodes a JSON response body. Uses orjson, which is considerably faster than `response.json()`.
+        """
+        return orjson.loads(response.content)
@@ -0,0 +1,73 @@
+import stat
+import time
+
+import pytest
+
+from src.utils import disk_cache
+from src.utils.disk_cache import DiskCache
+
+PROFILE = 'beta-test'
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / '.spotificity'
+    monkeypatch.setattr(disk_cache, 'CACHE_DIR', cache_dir)
+    return cache_dir
+
+
+def test_write_then_read_returns_data():
+    DiskCache.write(PROFILE, 'artists', {'id': 'name'}, ttl=60)
+    assert DiskCache.read(PROFILE, 'artists') == {'id': 'name'}
+
+
+def test_read_missing_file_returns_none():
+    assert DiskCache.read(PROFILE, 'artists') is None
+
+
+def test_read_expired_entry_returns_none(monkeypatch):
+    DiskCache.write(PROFILE, 'token', {'access_token': 'abc'}, ttl=60)
+    expired_at = time.time() + 61
+    monkeypatch.setattr(disk_cache.time, 'time', lambda: expired_at)
+    assert DiskCache.read(PROFILE, 'token') is None
+
+
+@pytest.mark.parametrize(
+    'contents',
+    [
+        b'not json',
+        b'[1, 2, 3]',
+        b'{"expires_at": "tomorrow", "data": {}}',
+        b'{"data": {}}',
+    ],
+)
+def test_read_malformed_file_returns_none(cache_dir, contents):
+    path = cache_dir / PROFILE / 'token.json'
+    path.parent.mkdir(parents=True)
+    path.write_bytes(contents)
+    assert DiskCache.read(PROFILE, 'token') is None
+
+
+def test_invalidate_removes_entry():
+    DiskCache.write(PROFILE, 'artists', {'id': 'name'}, ttl=60)
+    DiskCache.invalidate(PROFILE, 'artists')
+    assert DiskCache.read(PROFILE, 'artists') is None
+
+
+def test_invalidate_missing_entry_is_a_no_op():
+    DiskCache.invalidate(PROFILE, 'artists')
+
+
+def test_write_keeps_cache_private(cache_dir):
+    # Simulate a cache left behind with default permissions
+    (cache_dir / PROFILE).mkdir(parents=True, mode=0o755)
+    path = cache_dir / PROFILE / 'token.json'
+    path.write_bytes(b'{}')
+    path.chmod(0o644)
+
+    DiskCache.write(PROFILE, 'token', {'access_token': 'abc'}, ttl=60)
+
+    assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+    assert stat.S_IMODE((cache_dir / PROFILE).stat().st_mode) == 0o700
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert list((cache_dir / PROFILE).iterdir()) == [path]